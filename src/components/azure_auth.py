@@ -1,3 +1,7 @@
+from functools import cache
+
+
+@cache
 def get_token_provider_default():
     from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 
@@ -16,6 +20,7 @@ def get_token_provider_default():
     return token_provider
 
 
+@cache
 def get_token_provider_streamlit_secrets():
     import streamlit as st
     from azure.identity import ClientSecretCredential, get_bearer_token_provider
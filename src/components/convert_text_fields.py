@@ -1,5 +1,8 @@
 from docx import Document
 import re
+from bisect import bisect_right
+from copy import deepcopy
+from typing import List, NamedTuple
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 import logging
@@ -9,12 +12,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Qualified attribute names, resolved once instead of calling qn() per element
+_QN_FLDCHARTYPE = qn("w:fldCharType")
+
+
+def _fld_char_template(fld_char_type):
+    """Build a w:fldChar element of the given type, used as a template for copies."""
+    element = OxmlElement("w:fldChar")
+    element.set(_QN_FLDCHARTYPE, fld_char_type)
+    return element
+
+
+# Field characters are identical for every field, so they are cloned from
+# these templates instead of being constructed and configured each time
+_FLDCHAR_TEMPLATES = {
+    fld_char_type: _fld_char_template(fld_char_type)
+    for fld_char_type in ("begin", "separate", "end")
+}
+
+
+class FieldMatch(NamedTuple):
+    """A text field found in a paragraph, with its position in the paragraph text."""
+
+    start: int
+    end: int
+    text: str
+    type: str
+    params: List[str]
+
 
 class FieldConverter:
     """Class to convert text representations of Word fields into actual Word fields."""
 
     def __init__(self):
-        self.field_regex = re.compile(r"{([^{}]*)({[^{}]*})[^{}]*}|{([^{}]*)}")
+        self.brace_regex = re.compile(r"[{}]")
+        self.if_token_regex = re.compile(r'[" {}]')
 
     def process_document(self, doc):
         """Process a Word document and convert text fields to actual fields."""
@@ -46,19 +78,35 @@ class FieldConverter:
 
     def _convert_paragraph_fields(self, paragraph):
         """Convert text fields in a paragraph to actual fields."""
-        # We need to work with runs since fields can span multiple runs
-        runs_text = "".join([run.text for run in paragraph.runs])
+        # We need to work with runs since fields can span multiple runs.
+        # paragraph.runs rebuilds its list from the XML on every access, so read it once.
+        runs = paragraph.runs
+        runs_text = "".join([run.text for run in runs])
 
         # Find potential fields in the combined text
         field_matches = self._find_field_matches(runs_text)
 
         if field_matches:
+            # Remember where each non-empty run started and its formatting,
+            # so the rebuilt runs can keep the original styling
+            run_starts = []
+            run_props = []
+            current_pos = 0
+            for run in runs:
+                run_text = run.text
+                if run_text:
+                    run_starts.append(current_pos)
+                    run_props.append(run._r.rPr)
+                    current_pos += len(run_text)
+
             # Clear the paragraph
-            for i in range(len(paragraph.runs) - 1, -1, -1):
-                paragraph._p.remove(paragraph.runs[i]._r)
+            for run in reversed(runs):
+                paragraph._p.remove(run._r)
 
-            # Add the text back with actual fields
-            self._add_text_with_fields(paragraph, runs_text, field_matches)
+            # Add the text back with actual fields in a single pass
+            self._add_text_with_fields(
+                paragraph, runs_text, field_matches, run_starts, run_props
+            )
 
     def _find_field_matches(self, text):
         """Find all potential field matches in text."""
@@ -74,7 +122,7 @@ class FieldConverter:
                 break
 
             matches.append(match)
-            start_pos = match["end"]
+            start_pos = match.end
 
         return matches
 
@@ -85,25 +133,27 @@ class FieldConverter:
         open_braces = 0
         field_start = -1
 
-        for i in range(start_pos, len(text)):
-            if text[i] == "{":
+        # Jump from brace to brace instead of visiting every character
+        for brace in self.brace_regex.finditer(text, start_pos):
+            i = brace.start()
+            if brace.group() == "{":
                 if open_braces == 0:
                     field_start = i
                 open_braces += 1
-            elif text[i] == "}":
+            else:
                 open_braces -= 1
                 if open_braces == 0 and field_start != -1:
                     field_text = text[field_start : i + 1]
                     field_type, params = self._parse_field(field_text)
 
                     if field_type:
-                        return {
-                            "start": field_start,
-                            "end": i + 1,
-                            "text": field_text,
-                            "type": field_type,
-                            "params": params,
-                        }
+                        return FieldMatch(
+                            start=field_start,
+                            end=i + 1,
+                            text=field_text,
+                            type=field_type,
+                            params=params,
+                        )
                     break
 
         return None
@@ -131,57 +181,80 @@ class FieldConverter:
         """Split an IF field text into its components."""
         # This is complex due to nested fields
         # A simplified version for demonstration
+        # Parts are slices of if_text between top-level separator spaces, so only
+        # the characters that change the parsing state need to be visited
         parts = []
-        current_part = ""
+        part_start = 0
         in_quotes = False
         open_braces = 0
 
-        for char in if_text:
-            if char == '"' and open_braces == 0:
-                in_quotes = not in_quotes
-                current_part += char
+        for token in self.if_token_regex.finditer(if_text):
+            char = token.group()
+            if char == '"':
+                if open_braces == 0:
+                    in_quotes = not in_quotes
             elif char == "{":
                 open_braces += 1
-                current_part += char
             elif char == "}":
                 open_braces -= 1
-                current_part += char
-            elif char in (" ") and not in_quotes and open_braces == 0:
-                if current_part:
-                    parts.append(current_part.strip())
-                    current_part = ""
-            else:
-                current_part += char
+            elif not in_quotes and open_braces == 0:
+                i = token.start()
+                if i > part_start:
+                    parts.append(if_text[part_start:i].strip())
+                part_start = i + 1
 
-        if current_part:
-            parts.append(current_part.strip())
+        if part_start < len(if_text):
+            parts.append(if_text[part_start:].strip())
 
         return parts
 
-    def _add_text_with_fields(self, paragraph, original_text, field_matches):
+    def _add_text_with_fields(
+        self, paragraph, original_text, field_matches, run_starts, run_props
+    ):
         """Add text back to paragraph with actual fields replacing text fields."""
         last_end = 0
 
         for match in field_matches:
             # Add text before this field
-            if match["start"] > last_end:
-                paragraph.add_run(original_text[last_end : match["start"]])
+            if match.start > last_end:
+                self._add_styled_run(
+                    paragraph,
+                    original_text[last_end : match.start],
+                    self._run_props_at(run_starts, run_props, last_end),
+                )
 
             # Add the actual field
             self._add_field(paragraph, match)
 
-            last_end = match["end"]
+            last_end = match.end
 
         # Add any remaining text
         if last_end < len(original_text):
-            paragraph.add_run(original_text[last_end:])
+            self._add_styled_run(
+                paragraph,
+                original_text[last_end:],
+                self._run_props_at(run_starts, run_props, last_end),
+            )
+
+    def _run_props_at(self, run_starts, run_props, position):
+        """Return the run properties (w:rPr) of the original run containing position."""
+        if not run_starts:
+            return None
+        return run_props[bisect_right(run_starts, position) - 1]
+
+    def _add_styled_run(self, paragraph, text, run_props):
+        """Add a text run, copying the given run properties onto it."""
+        run = paragraph.add_run(text)
+        if run_props is not None:
+            run._r.insert(0, deepcopy(run_props))
+        return run
 
     def _add_field(self, paragraph, field_match):
         """Add an actual Word field to the paragraph."""
-        if field_match["type"] == "MERGEFIELD":
-            self._add_merge_field(paragraph, field_match["params"][0])
-        elif field_match["type"] == "IF":
-            self._add_if_field(paragraph, field_match["params"])
+        if field_match.type == "MERGEFIELD":
+            self._add_merge_field(paragraph, field_match.params[0])
+        elif field_match.type == "IF":
+            self._add_if_field(paragraph, field_match.params)
         # Add other field types as needed
 
     def _add_merge_field(self, paragraph, field_name):
@@ -189,7 +262,7 @@ class FieldConverter:
         run = paragraph.add_run()
 
         # Create the field begin element
-        begin = self._create_element("w:fldChar", {"w:fldCharType": "begin"})
+        begin = self._create_fld_char("begin")
         run._r.append(begin)
 
         # Create the field code
@@ -198,11 +271,11 @@ class FieldConverter:
         run._r.append(instr_text)
 
         # Create the field separator
-        separator = self._create_element("w:fldChar", {"w:fldCharType": "separate"})
+        separator = self._create_fld_char("separate")
         run._r.append(separator)
 
         # Create the field end element
-        end = self._create_element("w:fldChar", {"w:fldCharType": "end"})
+        end = self._create_fld_char("end")
         run._r.append(end)
 
     def _add_if_field(self, paragraph, if_params):
@@ -212,7 +285,7 @@ class FieldConverter:
         run = paragraph.add_run()
 
         # Create the field begin element
-        begin = self._create_element("w:fldChar", {"w:fldCharType": "begin"})
+        begin = self._create_fld_char("begin")
         run._r.append(begin)
 
         # Create the field code for IF
@@ -221,15 +294,19 @@ class FieldConverter:
         run._r.append(instr_text)
 
         # Create the field separator
-        separator = self._create_element("w:fldChar", {"w:fldCharType": "separate"})
+        separator = self._create_fld_char("separate")
         run._r.append(separator)
 
         # Add result text here if needed
 
         # Create the field end element
-        end = self._create_element("w:fldChar", {"w:fldCharType": "end"})
+        end = self._create_fld_char("end")
         run._r.append(end)
 
+    def _create_fld_char(self, fld_char_type):
+        """Create a w:fldChar element by copying its prebuilt template."""
+        return deepcopy(_FLDCHAR_TEMPLATES[fld_char_type])
+
     def _create_element(self, name, attrs=None):
         """Create an XML element with namespace."""
         element = OxmlElement(name)
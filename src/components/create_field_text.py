@@ -3,13 +3,75 @@ Module for converting regex matches to Word field replacement text.
 """
 
 import re
-from typing import Dict, List, Any, Optional
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 import logging
+from src.components.regex_list import IF_BETINGELSE_PATTERN
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _build_title_mapper(items: Tuple[Tuple[str, str], ...]) -> Callable[[str], str]:
+    """
+    Build a replacement function specialised for one title-to-key mapping.
+
+    Occurrences are accepted longest title first and skipped when they overlap
+    an already accepted one, so applying the mapping joins the untouched
+    segments with the keys once instead of rebuilding the text per title.
+
+    Args:
+        items: The mapping's (title, key) pairs
+
+    Returns:
+        Function replacing every title in a text with its key
+    """
+    keys = {title: key for title, key in items if title}
+    if not keys:
+        return lambda text: text
+
+    # Sort titles by length (descending) to handle overlapping matches properly
+    sorted_titles = sorted(keys, key=len, reverse=True)
+
+    def apply(text: str) -> str:
+        used_starts: List[int] = []
+        used_ends: List[int] = []
+        used_keys: List[str] = []
+        for title in sorted_titles:
+            start = text.find(title)
+            while start != -1:
+                end = start + len(title)
+                idx = bisect_left(used_starts, end)
+                if idx == 0 or used_ends[idx - 1] <= start:
+                    used_starts.insert(idx, start)
+                    used_ends.insert(idx, end)
+                    used_keys.insert(idx, keys[title])
+                    start = text.find(title, end)
+                else:
+                    start = text.find(title, start + 1)
+
+        if not used_starts:
+            return text
+
+        parts = []
+        last_end = 0
+        for start, end, key in zip(used_starts, used_ends, used_keys):
+            parts.append(text[last_end:start])
+            parts.append(key)
+            last_end = end
+        parts.append(text[last_end:])
+        return "".join(parts)
+
+    return apply
+
+
+def _get_title_mapper(mapping: Dict[str, str]) -> Callable[[str], str]:
+    """Return the cached replacement function for the given mapping."""
+    return _build_title_mapper(tuple(mapping.items()))
+
+
 class PatternProcessor(ABC):
     """Abstract base class for processing different regex patterns."""
 
@@ -51,16 +113,7 @@ class IfElsePatternProcessor(PatternProcessor):
         if not mapping:
             return text
 
-        # Sort titles by length (descending) to handle overlapping matches properly
-        sorted_titles = sorted(mapping.keys(), key=len, reverse=True)
-
-        result_text = text
-        for title in sorted_titles:
-            if title in result_text:
-                key = mapping[title]
-                result_text = result_text.replace(title, key)
-
-        return result_text
+        return _get_title_mapper(mapping)(text)
 
     def process_match(
         self,
@@ -109,8 +162,7 @@ class PatternProcessorRegistry:
     def _register_default_processors(self):
         """Register default pattern processors."""
         # Register the IF-ELSE pattern processor
-        if_else_pattern = r'(?i)\s+if\s+betingelse\s+(.+?)\s*(?=[“”"])[“”"]([^“”"]*)[“”"]\s*else\s*[“”"]([^“”"]*)[“”"]'
-        self.register_processor(if_else_pattern, IfElsePatternProcessor())
+        self.register_processor(IF_BETINGELSE_PATTERN, IfElsePatternProcessor())
 
     def register_processor(self, pattern: str, processor: PatternProcessor):
         """Register a processor for a specific regex pattern."""
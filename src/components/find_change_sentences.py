@@ -5,9 +5,11 @@ Module for extracting and formatting regex matches from Word documents.
 import re
 from docx import Document
 import logging
-from typing import Dict, List, Any, Pattern, Optional, Set
+from functools import lru_cache
+from typing import Dict, List, Any, Pattern, Optional, Set, Union
 from io import BytesIO
 import json  # Add this import to fix the NameError
+from src.components.regex_list import REGEX_FLAGS, REQUIRED_LITERALS
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -76,47 +78,60 @@ class DocumentRegexFinder:
             list: List of match dicts, each with regex, fullText, groups.
         """
         doc_text = self.get_document_text(doc_path)
+        doc_text_lower = None
         results = []
         seen_full_texts: Set[str] = set()
         for pattern in patterns:
             pattern_str = pattern.pattern
+            # Skip the regex scan when a literal every match needs is absent
+            required_literal = REQUIRED_LITERALS.get(pattern_str)
+            if required_literal:
+                if doc_text_lower is None:
+                    doc_text_lower = doc_text.lower()
+                if required_literal not in doc_text_lower:
+                    continue
             matches = pattern.finditer(doc_text)
             for match in matches:
                 full_text = match.group(0)
                 if full_text in seen_full_texts:
                     continue
                 seen_full_texts.add(full_text)
-                groups = [
-                    match.group(i)
-                    for i in range(1, len(match.groups()) + 1)
-                    if match.group(i) is not None
-                ]
+                groups = [group for group in match.groups() if group is not None]
                 results.append(
                     {"regex": pattern_str, "fullText": full_text, "groups": groups}
                 )
         return results
 
 
+@lru_cache(maxsize=64)
+def _compile_regex(regex_str: str) -> Pattern:
+    """Compile a regex pattern string, reusing earlier compilations."""
+    return re.compile(regex_str, REGEX_FLAGS)
+
+
 def extract_and_format_regex_matches(
-    doc_path: str, regex_list: List[str]
+    doc_path: str, regex_list: List[Union[str, Pattern]]
 ) -> List[Dict[str, Any]]:
     """
     Extracts regex matches from a Word document.
 
     Args:
         doc_path: Path to the Word document.
-        regex_list: List of regex pattern strings.
+        regex_list: List of regex pattern strings or precompiled patterns
+            (e.g. from RegexList.get_compiled()).
 
     Returns:
         list: List of match dicts.
     """
     compiled_patterns = []
-    for regex_str in regex_list:
+    for regex in regex_list:
+        if isinstance(regex, re.Pattern):
+            compiled_patterns.append(regex)
+            continue
         try:
-            pattern = re.compile(regex_str, re.DOTALL | re.UNICODE)
-            compiled_patterns.append(pattern)
+            compiled_patterns.append(_compile_regex(regex))
         except re.error as e:
-            logger.error(f"Invalid regex pattern '{regex_str}': {e}")
+            logger.error(f"Invalid regex pattern '{regex}': {e}")
     finder = DocumentRegexFinder()
     results = finder.find_regex_matches_in_document(doc_path, compiled_patterns)
     return results
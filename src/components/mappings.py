@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 import pandas as pd
 
 
@@ -24,3 +25,15 @@ def load_uploaded_mappings(uploaded_file):
         return {row["Titel"]: row["Nøgle"] for _, row in df.iterrows()}, None
     except Exception as e:
         return None, f"Fejl ved behandling af Excel-fil: {str(e)}"
+
+
+@lru_cache(maxsize=16)
+def _sort_titles_by_length(titles):
+    return tuple(
+        (title, title.lower()) for title in sorted(titles, key=len, reverse=True)
+    )
+
+
+def sorted_titles(mappings):
+    """Return (title, lowercased title) pairs sorted by length (descending), cached per key set."""
+    return _sort_titles_by_length(tuple(mappings))
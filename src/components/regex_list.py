@@ -1,15 +1,33 @@
 # Simple class to hold and return regexes
+import re
+
+# Pattern strings are defined once here, since they double as keys in the
+# PatternProcessorRegistry and must match the processors registered there.
+#
+# The condition words (first group) may not contain quote characters. This keeps
+# the lazy group from scanning past quotes and backtracking over the rest of the
+# document, so each attempt stops at the first quote it meets.
+IF_BETINGELSE_PATTERN = r'(?i)\s+if\s+betingelse\s+([^“”"]+?)\s*[“”"]([^“”"]*)[“”"]\s*else\s*[“”"]([^“”"]*)[“”"]'
+# ELSE_TIL_IF_PATTERN = r'(?i)Else til if betingelse\s+(.+?)\s*[“”"]([^“”"]*)[“”"]'
+
+# Lowercase literal that every match of a pattern contains. Documents without it
+# cannot match the pattern, so the regex scan can be skipped.
+REQUIRED_LITERALS = {IF_BETINGELSE_PATTERN: "betingelse"}
+
+# Flags used whenever the patterns are compiled for matching against documents
+REGEX_FLAGS = re.DOTALL | re.UNICODE
 
 
 class RegexList:
     def __init__(self, regexes=None):
         if regexes is None:
-            # Example: two random regexes
-            regexes = [
-                r'(?i)\s+if\s+betingelse\s+(.+?)\s*(?=[“”"])[“”"]([^“”"]*)[“”"]\s*else\s*[“”"]([^“”"]*)[“”"]'
-                # ,r'(?i)Else til if betingelse\s+(.+?)\s*[“”"]([^“”"]*)[“”"]',
-            ]
+            regexes = [IF_BETINGELSE_PATTERN]
         self._regexes = regexes
+        # Compile once here so repeated document runs reuse the same patterns
+        self._compiled = [re.compile(regex, REGEX_FLAGS) for regex in regexes]
 
     def get_regexes(self):
         return self._regexes
+
+    def get_compiled(self):
+        return self._compiled
@@ -1,39 +1,27 @@
+from copy import deepcopy
 from docx import Document
 from io import BytesIO
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 import json
+import os
 import re
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
-from langchain_core.tools import tool
-from typing import IO
-from typing import Annotated, NotRequired
-from langchain_core.tools import tool
-from langgraph.prebuilt import InjectedState, create_react_agent
-from langgraph.prebuilt.chat_agent_executor import AgentState
-from operator import add
-from typing import Annotated
-from langgraph.types import Command
-from langchain_core.messages import ToolMessage
-from langchain_core.tools import tool, InjectedToolCallId
-from langchain_core.messages import AnyMessage, SystemMessage, HumanMessage
-from langgraph.graph.message import add_messages
+from typing import Dict, List, NamedTuple, Tuple
 from loguru import logger
+from lxml import etree
 
+# Patterns used by _normalize_text_for_matching, compiled once at import
+_DOUBLE_QUOTES_REGEX = re.compile(r'["""]')
+_SINGLE_QUOTES_REGEX = re.compile(r"[''']")
+_WHITESPACE_REGEX = re.compile(r"\s+")
 
-class CustomState(AgentState):
-    # The user_name field in short-term state
-    messages: Annotated[list[AnyMessage], add_messages]
-    document: Annotated[list[bytes], add]
+# Patterns used by _fix_replacement_text
+_MERGEFIELD_CLOSE_REGEX = re.compile(r'}\s*"\s*"\s*')
+_TEXT_VALUE_REGEX = re.compile(r'"\s*"\s*([^"]+)"\s*"\s*')
 
 
-class CustomState(AgentState):
-    # The user_name field in short-term state
-    document: Annotated[list[bytes], add]
-
-
-@dataclass
-class ReplacementMatch:
-    """Data class to store information about a text match and its replacement."""
+class ReplacementMatch(NamedTuple):
+    """Information about a text match and its replacement."""
 
     original_text: str
     replacement_text: str
@@ -60,75 +48,93 @@ def replace_text(
     # Load the document from bytes
     doc = Document(BytesIO(doc))
 
-    # Process all paragraphs in the document
-    for paragraph in doc.paragraphs:
-        _process_paragraph(paragraph, replacement_pairs)
+    # Unpack the replacement pairs once rather than in every paragraph
+    patterns = _prepare_patterns(replacement_pairs)
+
+    # Process the body paragraphs and the paragraphs of table cells
+    for paragraph in _iter_paragraphs(doc):
+        _process_paragraph(paragraph, patterns)
 
-    # Process all tables in the document
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    _process_paragraph(paragraph, replacement_pairs)
     output_stream = BytesIO()
     doc.save(output_stream)
     logger.info("Text replacement process complete")
     return output_stream.getvalue()
 
 
-def _process_paragraph(paragraph, json_data: List[Dict]):
+def _iter_paragraphs(doc):
+    """Yield the body paragraphs, then the paragraphs of each table cell.
+
+    Horizontally merged cells appear several times in row.cells, so each cell
+    is visited once. Text in text boxes, content controls and nested tables is
+    not touched.
+    """
+    yield from doc.paragraphs
+
+    seen_cells = set()
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                if cell._tc not in seen_cells:
+                    seen_cells.add(cell._tc)
+                    yield from cell.paragraphs
+
+
+def _prepare_patterns(replacement_pairs: List[Dict]) -> List[Tuple[str, str]]:
+    """Collect the (original, replacement) text pairs to search for, skipping empty originals.
+
+    Replacement texts are fixed up once here instead of for every match.
+    """
+    patterns = []
+    for replacement_data in replacement_pairs:
+        original_text = replacement_data.get("originalText", "")
+        if original_text:
+            replacement_text = replacement_data.get("replacementText", "")
+            patterns.append((original_text, _fix_replacement_text(replacement_text)))
+    return patterns
+
+
+def _process_paragraph(paragraph, patterns: List[Tuple[str, str]]):
     """Process a single paragraph for text replacements."""
-    if not paragraph.runs:
+    # paragraph.runs re-walks the paragraph XML on every access, so read it once
+    runs = paragraph.runs
+    if not runs:
         return
 
     # Get the complete text from all runs in the paragraph
-    full_paragraph_text = _get_paragraph_text(paragraph)
+    full_paragraph_text = "".join(run.text for run in runs)
 
-    if not full_paragraph_text.strip():
+    # isspace() stops at the first visible character instead of copying like strip()
+    if not full_paragraph_text or full_paragraph_text.isspace():
         return
 
-    logger.debug(f"Processing paragraph: '{full_paragraph_text[:100]}...'")
+    # Debug messages pass their values as arguments so loguru only formats
+    # them when a handler actually records DEBUG
+    logger.debug("Processing paragraph: '{}...'", full_paragraph_text[:100])
 
     # Find all matches for all patterns in this paragraph
-    all_matches = _find_all_matches(full_paragraph_text, json_data)
-
-    if all_matches:
-        logger.debug(f"Found {len(all_matches)} matches in paragraph")
+    all_matches = _find_all_matches(full_paragraph_text, patterns)
 
-        # Remove overlapping matches (keep the first occurrence)
-        all_matches = _remove_overlapping_matches(all_matches)
-        logger.debug(f"After removing overlaps: {len(all_matches)} matches")
-
-        # Sort matches by position (reverse order to replace from end to beginning)
-        all_matches.sort(key=lambda x: x.start_pos, reverse=True)
+    if not all_matches:
+        return
 
-        # Apply replacements one by one
-        for i, match in enumerate(all_matches):
-            logger.debug(
-                f"Applying match {i+1}/{len(all_matches)}: '{match.original_text}' -> '{match.replacement_text}'"
-            )
-            _apply_replacement(paragraph, match)
+    logger.debug("Found {} matches in paragraph", len(all_matches))
 
+    # Remove overlapping matches (keep the first occurrence)
+    all_matches = _remove_overlapping_matches(all_matches)
+    logger.debug("After removing overlaps: {} matches", len(all_matches))
 
-def _get_paragraph_text(paragraph) -> str:
-    """Get the complete text from all runs in a paragraph."""
-    return "".join(run.text for run in paragraph.runs)
+    # Splice every replacement in and rebuild the runs once
+    _rebuild_paragraph_runs(paragraph, runs, full_paragraph_text, all_matches)
 
 
 def _find_all_matches(
-    paragraph_text: str, json_data: List[Dict]
+    paragraph_text: str, patterns: List[Tuple[str, str]]
 ) -> List[ReplacementMatch]:
     """Find all matches for all patterns in the given text."""
     matches = []
 
-    # Iterate through each match object in the JSON data
-    for replacement_data in json_data:
-        original_text = replacement_data.get("originalText", "")
-        replacement_text = replacement_data.get("replacementText", "")
-
-        if not original_text:
-            continue
-
+    # Iterate through each prepared (original, replacement) pair
+    for original_text, replacement_text in patterns:
         # Find all occurrences of the originalText in the paragraph
         text_matches = _find_text_occurrences(paragraph_text, original_text)
 
@@ -148,34 +154,42 @@ def _find_text_occurrences(text: str, search_text: str) -> List[Tuple[int, int]]
     """Find all occurrences of search_text in text, handling case sensitivity and whitespace."""
     matches = []
 
-    # First try exact matching
-    exact_matches = _find_exact_matches(text, search_text)
-    if exact_matches:
-        return exact_matches
+    # First try exact matching; the C-level containment test settles the
+    # common no-hit case without setting up the match scan
+    if search_text in text:
+        return _find_exact_matches(text, search_text)
 
     # If no exact matches, try normalized matching
-    # Clean up the search text - normalize quotes and whitespace
-    search_text_clean = _normalize_text_for_matching(search_text)
-    text_clean = _normalize_text_for_matching(text)
+    # Clean up the search text - normalize quotes and whitespace and lowercase
+    # both sides once to handle case variations
+    search_text_clean = _normalize_for_search(search_text)
 
     if not search_text_clean:
         return matches
 
-    logger.debug(f"Looking for: '{search_text_clean}' in: '{text_clean}'")
+    text_clean = _normalize_for_search(text)
+    normalized_text = _normalize_text_for_matching(text)
+
+    logger.debug("Looking for: '{}' in: '{}'", search_text_clean, text_clean)
 
-    # Use case-insensitive search to handle variations
     start = 0
     while True:
-        pos = text_clean.lower().find(search_text_clean.lower(), start)
+        pos = text_clean.find(search_text_clean, start)
         if pos == -1:
             break
 
-        logger.debug(f"Found match at normalized position {pos}")
+        logger.debug("Found match at normalized position {}", pos)
+
+        # Map back to the normalized text first; lowercasing shifts positions
+        # when a character (e.g. "İ") lowercases to several characters
+        norm_start, norm_end = pos, pos + len(search_text_clean)
+        if len(text_clean) != len(normalized_text):
+            lower_map = _build_lower_map(normalized_text)
+            norm_start, norm_end = lower_map[norm_start], lower_map[norm_end - 1] + 1
 
         # Map back to original text positions
-        original_start = _map_normalized_to_original_position(text, text_clean, pos)
-        original_end = _map_normalized_to_original_position(
-            text, text_clean, pos + len(search_text_clean)
+        original_start, original_end = _map_normalized_to_original_position(
+            text, len(normalized_text), norm_start, norm_end
         )
 
         # Validate that this is a reasonable match by checking the actual text
@@ -184,9 +198,9 @@ def _find_text_occurrences(text: str, search_text: str) -> List[Tuple[int, int]]
             # Only accept if the match looks reasonable (similar length and content)
             if _is_reasonable_match(actual_text, search_text):
                 logger.debug(
-                    f"Mapped to original positions: {original_start}-{original_end}"
+                    "Mapped to original positions: {}-{}", original_start, original_end
                 )
-                logger.debug(f"Original text segment: '{actual_text}'")
+                logger.debug("Original text segment: '{}'", actual_text)
                 matches.append((original_start, original_end))
 
         start = pos + len(search_text_clean)  # Move past this match
@@ -216,9 +230,9 @@ def _is_reasonable_match(found_text: str, search_text: str) -> bool:
     if len_ratio < 0.8 or len_ratio > 1.2:
         return False
 
-    # Check if key words are present
+    # Check if key words are present (a set keeps each membership test O(1))
     search_words = search_text.lower().split()
-    found_words = found_text.lower().split()
+    found_words = set(found_text.lower().split())
 
     # At least 70% of words should be present
     common_words = sum(1 for word in search_words if word in found_words)
@@ -227,108 +241,80 @@ def _is_reasonable_match(found_text: str, search_text: str) -> bool:
     return word_ratio >= 0.7
 
 
+@lru_cache(maxsize=4096)
 def _normalize_text_for_matching(text: str) -> str:
     """Normalize text for better matching by handling quotes and whitespace."""
     # Replace different types of quotes with standard quotes
-    text = re.sub(r'["""]', '"', text)
-    text = re.sub(r"[''']", "'", text)
+    text = _DOUBLE_QUOTES_REGEX.sub('"', text)
+    text = _SINGLE_QUOTES_REGEX.sub("'", text)
 
     # Normalize whitespace but preserve structure
-    text = re.sub(r"\s+", " ", text.strip())
+    text = _WHITESPACE_REGEX.sub(" ", text.strip())
 
     return text
 
 
+@lru_cache(maxsize=4096)
+def _normalize_for_search(text: str) -> str:
+    """Normalize text and lowercase it for case-insensitive searching."""
+    return _normalize_text_for_matching(text).lower()
+
+
+@lru_cache(maxsize=256)
+def _build_lower_map(normalized_text: str) -> Tuple[int, ...]:
+    """Map each character of the lowercased text to its position in the normalized text."""
+    lower_to_norm = []
+    for index, char in enumerate(normalized_text):
+        lower_to_norm.extend([index] * len(char.lower()))
+    return tuple(lower_to_norm)
+
+
+@lru_cache(maxsize=256)
+def _build_norm_map(original_text: str) -> Tuple[int, ...]:
+    """Map each original position to its position in the normalized text.
+
+    Quotes are normalized one-to-one, so only whitespace moves positions. Each
+    whitespace run gets one entry more than its length, all at the position of
+    its single normalized space, and leading whitespace is not skipped. That is
+    how the mapping has always been counted, so matching results are kept.
+    """
+    orig_to_norm = []
+    norm_pos = 0
+    pos = 0
+    for whitespace in _WHITESPACE_REGEX.finditer(original_text):
+        orig_to_norm.extend(range(norm_pos, norm_pos + whitespace.start() - pos))
+        norm_pos += whitespace.start() - pos
+        orig_to_norm.extend([norm_pos] * (whitespace.end() - whitespace.start() + 1))
+        norm_pos += 1
+        pos = whitespace.end()
+    orig_to_norm.extend(range(norm_pos, norm_pos + len(original_text) - pos))
+    orig_to_norm.append(norm_pos + len(original_text) - pos)
+
+    return tuple(orig_to_norm)
+
+
 def _map_normalized_to_original_position(
-    original_text: str, normalized_text: str, norm_pos: int
+    original_text: str, normalized_length: int, norm_start: int, norm_end: int
+) -> Tuple[int, int]:
+    """Map a span in the normalized text back to a span in the original text."""
+    norm_map = _build_norm_map(original_text)
+    return (
+        _map_normalized_position(original_text, norm_map, normalized_length, norm_start),
+        _map_normalized_position(original_text, norm_map, normalized_length, norm_end),
+    )
+
+
+def _map_normalized_position(
+    original_text: str, norm_map: Tuple[int, ...], normalized_length: int, norm_pos: int
 ) -> int:
-    """Map a position in normalized text back to original text."""
+    """Find the first original position that maps at or after norm_pos."""
     if norm_pos <= 0:
         return 0
-    if norm_pos >= len(normalized_text):
+    if norm_pos >= normalized_length:
         return len(original_text)
 
-    # Build character-by-character mapping
-    orig_to_norm = []  # Maps original position to normalized position
-    norm_pos_current = 0
-
-    i = 0
-    while i < len(original_text):
-        orig_char = original_text[i]
-        orig_to_norm.append(norm_pos_current)
-
-        # Handle quote normalization
-        if orig_char in '"' "'":
-            norm_pos_current += 1  # Normalized to standard quote
-        elif orig_char.isspace():
-            # Skip multiple consecutive whitespace in original
-            while i < len(original_text) and original_text[i].isspace():
-                orig_to_norm.append(norm_pos_current)
-                i += 1
-            norm_pos_current += 1  # Single space in normalized
-            continue  # i already incremented
-        else:
-            norm_pos_current += 1
-
-        i += 1
-
-    orig_to_norm.append(norm_pos_current)
-
-    # Find the original position that maps to the desired normalized position
-    for orig_pos, mapped_norm_pos in enumerate(orig_to_norm):
-        if mapped_norm_pos >= norm_pos:
-            return orig_pos
-
-    return len(original_text)
-
-
-def _find_actual_match_position(
-    current_text: str, search_text: str, expected_start: int
-) -> Optional[Tuple[int, int]]:
-    """Find the actual position of the search text in the current text."""
-    # First try the expected position
-    expected_end = expected_start + len(search_text)
-    if (
-        expected_start < len(current_text)
-        and expected_end <= len(current_text)
-        and current_text[expected_start:expected_end] == search_text
-    ):
-        return (expected_start, expected_end)
-
-    # If that fails, search for the text in the vicinity
-    search_start = max(0, expected_start - 50)
-    search_end = min(len(current_text), expected_start + len(search_text) + 50)
-    search_area = current_text[search_start:search_end]
-
-    # Normalize both texts for comparison
-    normalized_search = _normalize_text_for_matching(search_text)
-    normalized_area = _normalize_text_for_matching(search_area)
-
-    # Look for the normalized text
-    pos = normalized_area.lower().find(normalized_search.lower())
-    if pos != -1:
-        # Map back to original positions
-        actual_start = search_start + _map_normalized_to_original_position(
-            search_area, normalized_area, pos
-        )
-        actual_end = search_start + _map_normalized_to_original_position(
-            search_area, normalized_area, pos + len(normalized_search)
-        )
-        return (actual_start, actual_end)
-
-    # Last resort: search the entire text
-    normalized_current = _normalize_text_for_matching(current_text)
-    pos = normalized_current.lower().find(normalized_search.lower())
-    if pos != -1:
-        actual_start = _map_normalized_to_original_position(
-            current_text, normalized_current, pos
-        )
-        actual_end = _map_normalized_to_original_position(
-            current_text, normalized_current, pos + len(normalized_search)
-        )
-        return (actual_start, actual_end)
-
-    return None
+    # The map never decreases, so a binary search replaces the linear scan
+    return bisect_left(norm_map, norm_pos)
 
 
 def _fix_replacement_text(replacement_text: str) -> str:
@@ -346,10 +332,10 @@ def _fix_replacement_text(replacement_text: str) -> str:
 
     # Fix common quote and spacing issues
     # Ensure proper spacing around the MERGEFIELD closing brace
-    text = re.sub(r'}\s*"\s*"\s*', r'}" "', text)
+    text = _MERGEFIELD_CLOSE_REGEX.sub(r'}" "', text)
 
     # Fix spacing around the text values
-    text = re.sub(r'"\s*"\s*([^"]+)"\s*"\s*', r'" "\1" "', text)
+    text = _TEXT_VALUE_REGEX.sub(r'" "\1" "', text)
 
     return text
 
@@ -365,200 +351,146 @@ def _remove_overlapping_matches(
     sorted_matches = sorted(matches, key=lambda x: x.start_pos)
     non_overlapping = []
 
+    # Accepted matches never overlap and start in order, so a candidate can only
+    # collide with the last accepted one: tracking its end is enough
+    last_end = -1
     for match in sorted_matches:
-        # Check if this match overlaps with any accepted match
-        overlaps = False
-        for accepted in non_overlapping:
-            if (
-                match.start_pos < accepted.end_pos
-                and match.end_pos > accepted.start_pos
-            ):
-                overlaps = True
-                break
-
-        if not overlaps:
+        if match.start_pos >= last_end:
             non_overlapping.append(match)
+            last_end = match.end_pos
 
     return non_overlapping
 
 
-def _apply_replacement(paragraph, match: ReplacementMatch):
-    """Apply a single text replacement while preserving styling."""
-    # Get current paragraph text (it may have changed from previous replacements)
-    current_text = _get_paragraph_text(paragraph)
-
-    # For replacements done in reverse order, we need to search for the actual text
-    # instead of relying on fixed positions
-    actual_match_pos = _find_actual_match_position(
-        current_text, match.original_text, match.start_pos
-    )
+def _rebuild_paragraph_runs(
+    paragraph, runs, paragraph_text: str, matches: List[ReplacementMatch]
+):
+    """Rewrite the paragraph runs with all replacements applied, preserving styling.
 
-    if actual_match_pos is None:
-        logger.warning(
-            f"Could not find text '{match.original_text}' in current paragraph text"
+    Text outside the matches keeps the formatting of the run it came from, and
+    each replacement takes the formatting of the first character it replaces.
+    """
+    # Store original run information as parallel arrays. Non-empty runs are
+    # contiguous, so run i covers [run_starts[i], run_starts[i + 1]).
+    run_starts = []
+    run_props = []
+    current_pos = 0
+    # Word often splits identically formatted text over several runs; share one
+    # w:rPr per distinct formatting so equal formatting can be recognised by identity
+    interned_props = {}
+
+    for run in runs:
+        run_text = run.text
+        # Empty runs (formatting artifacts, field characters) cover no position
+        if not run_text:
+            continue
+        rPr = run._r.rPr
+        if rPr is not None:
+            rPr = interned_props.setdefault(etree.tostring(rPr), rPr)
+        run_starts.append(current_pos)
+        run_props.append(rPr)
+        current_pos += len(run_text)
+
+    # Build the new (text, run properties) segments in one left-to-right pass
+    segments = []
+    position = 0
+    for match in matches:
+        _append_original_segments(
+            segments, paragraph_text, run_starts, run_props, position, match.start_pos
         )
-        return
 
-    actual_start, actual_end = actual_match_pos
-
-    # Verify the match is still valid
-    if actual_end > len(current_text):
-        logger.warning(
-            f"Match position {actual_start}-{actual_end} exceeds current text length {len(current_text)}"
+        logger.debug(
+            "Replacing '{}' with '{}'",
+            paragraph_text[match.start_pos : match.end_pos],
+            match.replacement_text,
         )
-        return
-
-    # Get the styling from the first character of the match
-    source_style = _get_style_at_position(paragraph, actual_start)
-
-    # Fix the replacement text format
-    fixed_replacement = _fix_replacement_text(match.replacement_text)
-
-    # Create new text with replacement
-    new_text = (
-        current_text[:actual_start] + fixed_replacement + current_text[actual_end:]
-    )
-
-    logger.debug(
-        f"Replacing '{current_text[actual_start:actual_end]}' with '{fixed_replacement}'"
-    )
-
-    # Rebuild paragraph with new text
-    _replace_paragraph_text(
-        paragraph,
-        new_text,
-        source_style,
-        actual_start,
-        len(fixed_replacement),
+        segments.append(
+            (
+                match.replacement_text,
+                _find_props_for_original_position(
+                    run_starts, run_props, current_pos, match.start_pos
+                ),
+            )
+        )
+        position = match.end_pos
+    _append_original_segments(
+        segments, paragraph_text, run_starts, run_props, position, current_pos
     )
 
-
-def _get_style_at_position(paragraph, position: int) -> Dict:
-    """Get the style of the run at the specified position."""
-    current_pos = 0
-    for run in paragraph.runs:
-        run_end = current_pos + len(run.text)
-        if current_pos <= position < run_end:
-            return _extract_run_style(run)
-        current_pos = run_end
-
-    # If position is at the end, use the last run's style
-    if paragraph.runs:
-        return _extract_run_style(paragraph.runs[-1])
-
-    return {}
-
-
-def _replace_paragraph_text(
-    paragraph,
-    new_text: str,
-    replacement_style: Dict,
-    replacement_start: int,
-    replacement_length: int,
-):
-    """Replace the entire paragraph text while preserving as much styling as possible."""
-    # Store original run information
-    original_runs = []
-    current_pos = 0
-
-    for run in paragraph.runs:
-        run_info = {
-            "text": run.text,
-            "style": _extract_run_style(run),
-            "start": current_pos,
-            "end": current_pos + len(run.text),
-        }
-        original_runs.append(run_info)
-        current_pos += len(run.text)
-
     # Clear all runs
-    for i in range(len(paragraph.runs) - 1, -1, -1):
-        paragraph._element.remove(paragraph.runs[i]._element)
-
-    # Add new text with appropriate styling
-    if not new_text:
+    for run in runs:
+        paragraph._element.remove(run._element)
+
+    # Add the new text with the collected formatting, writing neighbouring
+    # segments that share it as a single run
+    pending_texts = []
+    pending_props = None
+    for segment_text, props in segments:
+        if not segment_text:
+            continue
+        if pending_texts and props is not pending_props:
+            _add_styled_run(paragraph, "".join(pending_texts), pending_props)
+            pending_texts = []
+        pending_texts.append(segment_text)
+        pending_props = props
+    if pending_texts:
+        _add_styled_run(paragraph, "".join(pending_texts), pending_props)
+
+
+def _append_original_segments(
+    segments: List[Tuple],
+    paragraph_text: str,
+    run_starts: List[int],
+    run_props: List,
+    start: int,
+    end: int,
+):
+    """Append the original text in [start, end) split at run boundaries, keeping each run's formatting."""
+    if start >= end:
         return
 
-    replacement_end = replacement_start + replacement_length
-
-    # Text before replacement
-    if replacement_start > 0:
-        before_text = new_text[:replacement_start]
-        before_style = _find_style_for_original_position(original_runs, 0)
-        if before_text:
-            run = paragraph.add_run(before_text)
-            _apply_run_style(run, before_style)
-
-    # Replacement text
-    if replacement_length > 0:
-        replacement_text = new_text[replacement_start:replacement_end]
-        if replacement_text:
-            run = paragraph.add_run(replacement_text)
-            _apply_run_style(run, replacement_style)
-
-    # Text after replacement
-    if replacement_end < len(new_text):
-        after_text = new_text[replacement_end:]
-        # The after text should use the style from the original position after the match
-        after_style = _find_style_for_original_position(
-            original_runs, replacement_start
-        )
-        if after_text:
-            run = paragraph.add_run(after_text)
-            _apply_run_style(run, after_style)
-
-
-def _find_style_for_original_position(original_runs: List[Dict], position: int) -> Dict:
-    """Find the style that was at a given position in the original text."""
-    for run_info in original_runs:
-        if run_info["start"] <= position < run_info["end"]:
-            return run_info["style"]
-
-    # If position is beyond the original text, use the last run's style
-    if original_runs:
-        return original_runs[-1]["style"]
-
-    return {}
-
+    index = bisect_right(run_starts, start) - 1
+    while start < end:
+        next_index = index + 1
+        run_end = run_starts[next_index] if next_index < len(run_starts) else end
+        piece_end = min(end, run_end)
+        segments.append((paragraph_text[start:piece_end], run_props[index]))
+        start = piece_end
+        index = next_index
+
+
+def _find_props_for_original_position(
+    run_starts: List[int],
+    run_props: List,
+    text_length: int,
+    position: int,
+):
+    """Find the run properties (w:rPr) that were at a given position in the original text."""
+    if not run_props:
+        return None
 
-def _extract_run_style(run) -> Dict:
-    """Extract styling information from a run."""
-    style = {
-        "font_name": run.font.name,
-        "font_size": run.font.size,
-        "bold": run.font.bold,
-        "italic": run.font.italic,
-        "underline": run.font.underline,
-        "color": None,
-        "highlight_color": run.font.highlight_color,
-    }
+    # If position is beyond the original text, use the last run's formatting
+    if position >= text_length:
+        return run_props[-1]
 
-    # Extract color if present
-    if run.font.color.rgb:
-        style["color"] = run.font.color.rgb
+    return run_props[bisect_right(run_starts, position) - 1]
 
-    return style
 
+def _add_styled_run(paragraph, text: str, run_props):
+    """Add a text run, copying the given run properties onto it."""
+    run = paragraph.add_run(text)
+    if run_props is not None:
+        # A full copy keeps formatting python-docx has no Font property for
+        # (character styles, theme colours, east-asian fonts, ...)
+        run._r.insert(0, deepcopy(run_props))
+    return run
 
-def _apply_run_style(run, style: Dict):
-    """Apply styling information to a run."""
-    if not style:
-        return
 
-    if style.get("font_name"):
-        run.font.name = style["font_name"]
-    if style.get("font_size"):
-        run.font.size = style["font_size"]
-    if style.get("bold") is not None:
-        run.font.bold = style["bold"]
-    if style.get("italic") is not None:
-        run.font.italic = style["italic"]
-    if style.get("underline") is not None:
-        run.font.underline = style["underline"]
-    if style.get("color"):
-        run.font.color.rgb = style["color"]
-    if style.get("highlight_color"):
-        run.font.highlight_color = style["highlight_color"]
+@lru_cache(maxsize=32)
+def _load_json_file(json_path: str, mtime: float):
+    """Load a JSON file; the modification time is part of the cache key so edits are picked up."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 
 def process_document_from_json_file(
@@ -575,21 +507,22 @@ def process_document_from_json_file(
     Returns:
         Modified document object
     """
-    # Load the document
-    doc = Document(doc_path)
+    # Load the document; replace_text works on the file's bytes
+    with open(doc_path, "rb") as f:
+        doc_bytes = f.read()
 
-    # Load the JSON data
-    with open(json_path, "r", encoding="utf-8") as f:
-        json_data = json.load(f)
+    # Load the JSON data (cached while the file is unchanged)
+    json_data = _load_json_file(json_path, os.path.getmtime(json_path))
 
     # Process the document
-    modified_doc = replace_text(doc, json_data)
+    modified_bytes = replace_text(doc_bytes, json_data)
 
     # Save the modified document
-    modified_doc.save(output_path)
+    with open(output_path, "wb") as f:
+        f.write(modified_bytes)
     logger.info(f"Document saved to {output_path}")
 
-    return modified_doc
+    return Document(BytesIO(modified_bytes))
 
 
 def process_document_from_json_string(
@@ -606,20 +539,22 @@ def process_document_from_json_string(
     Returns:
         Modified document object
     """
-    # Load the document
-    doc = Document(doc_path)
+    # Load the document; replace_text works on the file's bytes
+    with open(doc_path, "rb") as f:
+        doc_bytes = f.read()
 
     # Parse the JSON data
     json_data = json.loads(json_string)
 
     # Process the document
-    modified_doc = replace_text(doc, json_data)
+    modified_bytes = replace_text(doc_bytes, json_data)
 
     # Save the modified document
-    modified_doc.save(output_path)
+    with open(output_path, "wb") as f:
+        f.write(modified_bytes)
     logger.info(f"Document saved to {output_path}")
 
-    return modified_doc
+    return Document(BytesIO(modified_bytes))
 
 
 def replace_text_in_document(doc: Document, json_data: List[Dict]) -> Document:
@@ -642,10 +577,10 @@ if __name__ == "__main__":
 
     if len(sys.argv) < 4:
         print(
-            "Usage: python replace_field_text.py <input_docx> <json_file> <output_docx>"
+            "Usage: python replace_field_text_base.py <input_docx> <json_file> <output_docx>"
         )
         print(
-            "   or: python replace_field_text.py <input_docx> <json_string> <output_docx> --json-string"
+            "   or: python replace_field_text_base.py <input_docx> <json_string> <output_docx> --json-string"
         )
         sys.exit(1)
 
@@ -1,6 +1,8 @@
+from bisect import bisect_left
 from typing import List, Dict
 from docx import Document
 from io import BytesIO
+from src.components.mappings import sorted_titles
 
 
 def title_key_fetcher(
@@ -15,23 +17,20 @@ def title_key_fetcher(
     text = "\n".join([para.text for para in doc.paragraphs])
     text_lower = text.lower()
     # Sort titles by length descending to prioritize longer matches
-    sorted_titles = sorted(mappings.keys(), key=lambda t: len(t), reverse=True)
-    used_spans = []
+    # Accepted spans are disjoint, kept sorted by start in two parallel lists
+    used_starts = []
+    used_ends = []
     result = []
-    for titel in sorted_titles:
-        titel_lower = titel.lower()
+    for titel, titel_lower in sorted_titles(mappings):
         start = text_lower.find(titel_lower)
         if start != -1:
             end = start + len(titel_lower)
-            # Check for overlap with already used spans
-            overlap = False
-            for s, e in used_spans:
-                if not (end <= s or start >= e):
-                    overlap = True
-                    break
-            if not overlap:
+            # Only the used span starting closest before `end` can overlap
+            idx = bisect_left(used_starts, end)
+            if idx == 0 or used_ends[idx - 1] <= start:
                 result.append(
                     {"originalText": titel, "replacementText": mappings[titel]}
                 )
-                used_spans.append((start, end))
+                used_starts.insert(idx, start)
+                used_ends.insert(idx, end)
     return result
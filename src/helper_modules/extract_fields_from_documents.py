@@ -49,14 +49,64 @@ Each extracted field contains:
 
 import sys
 import re
+import posixpath
+import zipfile
+from copy import deepcopy
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import sys
-import re
-from docx import Document
-from docx.oxml.ns import nsdecls, qn
-from docx.oxml import parse_xml
-import xml.etree.ElementTree as ET
+from typing import Iterable, Iterator, List, Dict, Any, Optional
+from docx.oxml.ns import qn
+from lxml import etree
+
+_NAMESPACES = {
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "mc": "http://schemas.openxmlformats.org/markup-compatibility/2006",
+}
+
+# All runs below an element, in document order. Content under mc:Fallback repeats
+# the mc:Choice next to it (e.g. VML copies of text boxes), so it is left out.
+_FIND_RUNS = etree.XPath(".//w:r[not(ancestor::mc:Fallback)]", namespaces=_NAMESPACES)
+
+# Field characters, instruction text and text are direct children of a run. Deeper
+# runs, e.g. inside a text box held by the run, are collected and processed on their own.
+_FLD_CHAR_TAG = qn("w:fldChar")
+_INSTR_TEXT_TAG = qn("w:instrText")
+_TEXT_TAG = qn("w:t")
+
+# Clark-notation name of the attribute holding begin/separate/end on w:fldChar
+_FLD_CHAR_TYPE = qn("w:fldCharType")
+
+# Package relationships and the section references to their default header/footer
+_RELATIONSHIP_NAMESPACES = {
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships"
+}
+_FIND_RELATIONSHIPS = etree.XPath("./rel:Relationship", namespaces=_RELATIONSHIP_NAMESPACES)
+_FIND_SECTION_PROPERTIES = etree.XPath(
+    "./w:body/w:p/w:pPr/w:sectPr | ./w:body/w:sectPr", namespaces=_NAMESPACES
+)
+_FIND_DEFAULT_HEADER_IDS = etree.XPath(
+    "./w:headerReference[@w:type='default']/@r:id",
+    namespaces={**_NAMESPACES, "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships"},
+)
+_FIND_DEFAULT_FOOTER_IDS = etree.XPath(
+    "./w:footerReference[@w:type='default']/@r:id",
+    namespaces={**_NAMESPACES, "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships"},
+)
+
+# Field results shown between « and », and whitespace runs, in field codes
+_FIELD_RESULT_REGEX = re.compile(r"«[^»]*»")
+_WHITESPACE_REGEX = re.compile(r"\s+")
+
+# Field type: the first word of a cleaned field code, e.g. MERGEFIELD or IF
+_FIELD_TYPE_REGEX = re.compile(r"\S+")
+
+# Separator lines of the readable field report
+_REPORT_RULE = "=" * 60
+_FIELD_RULE = "─" * 40
+
+# Same settings python-docx parses document parts with
+_XML_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
 
 
 class WordFieldExtractor:
@@ -64,8 +114,8 @@ class WordFieldExtractor:
     A class to extract Word fields from documents, including nested fields.
 
     This class can handle various types of Word fields such as MERGEFIELD, IF, etc.
-    and properly parse nested field structures. It uses the python-docx library
-    to access the underlying XML structure of Word documents.
+    and properly parse nested field structures. It reads the underlying XML parts
+    of Word documents directly from the .docx package with lxml.
 
     Key Features:
     - Extracts complete nested field structures
@@ -89,6 +139,8 @@ class WordFieldExtractor:
     - Preserves exact formatting and structure
     """
 
+    __slots__ = ("document_path", "document", "header_footer_parts", "fields")
+
     def __init__(self, document_path: str):
         """
         Initialize the extractor with a document path.
@@ -98,163 +150,205 @@ class WordFieldExtractor:
         """
         self.document_path = Path(document_path)
         self.document = None
+        self.header_footer_parts = []
         self.fields = []
 
     def load_document(self) -> bool:
         """
-        Load the Word document.
+        Load the XML parts of the Word document that can contain fields.
+
+        Extraction only reads XML, so the main document part and its header and
+        footer parts are parsed straight from the package instead of building a
+        full python-docx Document.
 
         Returns:
             bool: True if document loaded successfully, False otherwise
         """
         try:
-            self.document = Document(self.document_path)
+            with zipfile.ZipFile(self.document_path) as package:
+                document_part = self._find_main_document_part(package)
+                self.document = etree.fromstring(
+                    package.read(document_part), _XML_PARSER
+                )
+                self.header_footer_parts = self._load_header_footer_parts(
+                    package, document_part
+                )
             return True
         except Exception as e:
             print(f"Error loading document: {e}")
             return False
 
-    def _collect_all_runs(self) -> List[Any]:
+    def _find_main_document_part(self, package: zipfile.ZipFile) -> str:
         """
-        Collect all runs from the entire document, maintaining order.
+        Find the name of the main document part from the package relationships.
+
+        Args:
+            package (zipfile.ZipFile): The opened .docx package
 
         Returns:
-            List[Any]: List of all XML run elements from the document
+            str: Name of the main document part, e.g. "word/document.xml"
         """
-        if not self.document:
-            return []
+        relationships = etree.fromstring(package.read("_rels/.rels"), _XML_PARSER)
+        for relationship in _FIND_RELATIONSHIPS(relationships):
+            if relationship.get("Type", "").endswith("/officeDocument"):
+                return relationship.get("Target").lstrip("/")
+        raise ValueError("The package has no main document part")
+
+    def _load_header_footer_parts(
+        self, package: zipfile.ZipFile, document_part: str
+    ) -> List[Any]:
+        """
+        Parse the default header and footer of every section, each part only once.
+
+        Sections without their own header/footer are linked to the previous one,
+        whose part has then already been parsed.
+
+        Args:
+            package (zipfile.ZipFile): The opened .docx package
+            document_part (str): Name of the main document part
+
+        Returns:
+            List[Any]: Root XML elements of the header and footer parts
+        """
+        part_folder, part_file = posixpath.split(document_part)
+        relationships_part = posixpath.join(part_folder, "_rels", part_file + ".rels")
+        relationships = etree.fromstring(package.read(relationships_part), _XML_PARSER)
+        targets = {
+            relationship.get("Id"): relationship.get("Target")
+            for relationship in _FIND_RELATIONSHIPS(relationships)
+        }
+
+        parts = []
+        seen_part_names = set()
+        for section_properties in _FIND_SECTION_PROPERTIES(self.document):
+            for relationship_id in _FIND_DEFAULT_HEADER_IDS(
+                section_properties
+            ) + _FIND_DEFAULT_FOOTER_IDS(section_properties):
+                target = targets[relationship_id]
+                if target.startswith("/"):
+                    part_name = target.lstrip("/")
+                else:
+                    part_name = posixpath.normpath(posixpath.join(part_folder, target))
+                if part_name not in seen_part_names:
+                    seen_part_names.add(part_name)
+                    parts.append(etree.fromstring(package.read(part_name), _XML_PARSER))
+        return parts
+
+    def _iter_all_runs(self) -> Iterator[Any]:
+        """
+        Iterate over all runs in the entire document, maintaining order.
+
+        Runs are produced one part at a time, so runs of the whole document
+        (body, headers and footers) are never held in a single list.
+
+        Returns:
+            Iterator[Any]: XML run elements from the document
+        """
+        if self.document is None:
+            return iter(())
+
+        # One compiled XPath per part yields its runs in document order, including
+        # runs inside tables, nested tables, text boxes and content controls.
+        # Headers and footers follow the body.
+        return chain.from_iterable(
+            _FIND_RUNS(part) for part in [self.document, *self.header_footer_parts]
+        )
 
-        all_runs = []
-        ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-
-        # Collect runs from main document body
-        for paragraph in self.document.paragraphs:
-            paragraph_xml = paragraph._element
-            runs = paragraph_xml.findall(".//w:r", ns)
-            all_runs.extend(runs)
-
-        # Collect runs from tables
-        for table in self.document.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        paragraph_xml = paragraph._element
-                        runs = paragraph_xml.findall(".//w:r", ns)
-                        all_runs.extend(runs)
-
-        # Collect runs from headers and footers
-        for section in self.document.sections:
-            if section.header:
-                for paragraph in section.header.paragraphs:
-                    paragraph_xml = paragraph._element
-                    runs = paragraph_xml.findall(".//w:r", ns)
-                    all_runs.extend(runs)
-
-            if section.footer:
-                for paragraph in section.footer.paragraphs:
-                    paragraph_xml = paragraph._element
-                    runs = paragraph_xml.findall(".//w:r", ns)
-                    all_runs.extend(runs)
-
-        return all_runs
-
-    def _process_runs_for_fields(self, runs) -> List[Dict[str, Any]]:
+    def _process_runs_for_fields(self, runs: Iterable[Any]) -> List[Dict[str, Any]]:
         """
-        Process a list of runs to extract fields that may span multiple paragraphs.
+        Process runs to extract fields that may span multiple paragraphs.
 
         Args:
-            runs: List of XML run elements
+            runs (Iterable[Any]): XML run elements in document order
 
         Returns:
             List[Dict[str, Any]]: List of extracted fields
         """
-        ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-
         fields = []
         field_nesting_level = 0
+        # Text buffers are reused for every top-level field
         current_field_code = []
         field_result_parts = []
         in_field_code = False
         in_field_result = False
 
         for run in runs:
-            # Check for field characters first
-            fld_chars = run.findall(".//w:fldChar", ns)
-
-            for fld_char in fld_chars:
-                fld_char_type = fld_char.get(qn("w:fldCharType"))
-
-                if fld_char_type == "begin":
-                    field_nesting_level += 1
-                    if field_nesting_level == 1:
-                        # Start of top-level field
-                        current_field_code = []
-                        field_result_parts = []
-                        in_field_code = True
-                        in_field_result = False
-                    else:
-                        # Nested field - add opening brace
-                        if in_field_code:
-                            current_field_code.append("{")
-
-                elif fld_char_type == "separate":
-                    if field_nesting_level == 1:
-                        # End of top-level field code, start of result
-                        in_field_code = False
-                        in_field_result = True
-
-                elif fld_char_type == "end":
-                    if field_nesting_level == 1:
-                        # End of top-level field
-                        field_code = "".join(current_field_code).strip()
-                        field_result = "".join(field_result_parts).strip()
-
-                        if field_code:
-                            # Clean up field code - remove field results (text in « »)
-                            cleaned_code = self._clean_field_code(field_code)
-
-                            field_info = {
-                                "type": (
-                                    cleaned_code.split()[0].upper()
-                                    if cleaned_code
-                                    else "unknown"
-                                ),
-                                "code": cleaned_code,
-                                "result": field_result,
-                                "nested_fields": self._find_nested_fields_improved(
-                                    cleaned_code
-                                ),
-                                "full_text": f"{{ {cleaned_code} }}",
-                            }
-                            fields.append(field_info)
-
-                        in_field_code = False
-                        in_field_result = False
-                    else:
-                        # End of nested field - add closing brace
+            # Walk the run's children once, in document order
+            for child in run:
+                tag = child.tag
+
+                if tag == _FLD_CHAR_TAG:
+                    fld_char_type = child.get(_FLD_CHAR_TYPE)
+
+                    if fld_char_type == "begin":
+                        field_nesting_level += 1
+                        if field_nesting_level == 1:
+                            # Start of top-level field
+                            current_field_code.clear()
+                            field_result_parts.clear()
+                            in_field_code = True
+                            in_field_result = False
+                        else:
+                            # Nested field - add opening brace
+                            if in_field_code:
+                                current_field_code.append("{")
+
+                    elif fld_char_type == "separate":
+                        if field_nesting_level == 1:
+                            # End of top-level field code, start of result
+                            in_field_code = False
+                            in_field_result = True
+
+                    elif fld_char_type == "end":
+                        if field_nesting_level == 1:
+                            # End of top-level field
+                            field_code = "".join(current_field_code).strip()
+                            field_result = "".join(field_result_parts).strip()
+
+                            if field_code:
+                                # Clean up field code - remove field results (text in « »)
+                                cleaned_code = self._clean_field_code(field_code)
+
+                                # The type is the first word of the code. Types
+                                # repeat across fields and are interned.
+                                type_match = _FIELD_TYPE_REGEX.match(cleaned_code)
+
+                                field_info = {
+                                    "type": (
+                                        sys.intern(type_match.group().upper())
+                                        if type_match
+                                        else "unknown"
+                                    ),
+                                    "code": cleaned_code,
+                                    "result": field_result,
+                                    "nested_fields": self._find_nested_fields_improved(
+                                        cleaned_code
+                                    ),
+                                    "full_text": f"{{ {cleaned_code} }}",
+                                }
+                                fields.append(field_info)
+
+                            in_field_code = False
+                            in_field_result = False
+                        else:
+                            # End of nested field - add closing brace
+                            if in_field_code:
+                                current_field_code.append("}")
+
+                        field_nesting_level -= 1
+
+                # Instruction text (field codes) - these are the actual field instructions
+                elif tag == _INSTR_TEXT_TAG:
+                    if in_field_code and child.text:
+                        current_field_code.append(child.text)
+
+                # Regular text - this includes both field code text and content text
+                elif tag == _TEXT_TAG:
+                    if child.text:
                         if in_field_code:
-                            current_field_code.append("}")
-
-                    field_nesting_level -= 1
-
-            # Process instruction text (field codes) - these are the actual field instructions
-            if in_field_code:
-                instr_texts = run.findall(".//w:instrText", ns)
-                for instr_text in instr_texts:
-                    if instr_text.text:
-                        current_field_code.append(instr_text.text)
-
-            # Process regular text - this includes both field code text and content text
-            if in_field_code:
-                text_elements = run.findall(".//w:t", ns)
-                for text_elem in text_elements:
-                    if text_elem.text:
-                        current_field_code.append(text_elem.text)
-            elif in_field_result:
-                text_elements = run.findall(".//w:t", ns)
-                for text_elem in text_elements:
-                    if text_elem.text:
-                        field_result_parts.append(text_elem.text)
+                            current_field_code.append(child.text)
+                        elif in_field_result:
+                            field_result_parts.append(child.text)
 
         return fields
 
@@ -269,10 +363,10 @@ class WordFieldExtractor:
             str: Cleaned field code
         """
         # Remove field results - text between « and »
-        cleaned = re.sub(r"«[^»]*»", "", field_code)
+        cleaned = _FIELD_RESULT_REGEX.sub("", field_code)
 
         # Clean up extra spaces
-        cleaned = re.sub(r"\s+", " ", cleaned)
+        cleaned = _WHITESPACE_REGEX.sub(" ", cleaned)
 
         return cleaned.strip()
 
@@ -281,84 +375,39 @@ class WordFieldExtractor:
         Improved method to find nested fields within a field code.
 
         Args:
-            field_code (str): The field code to search for nested fields
+            field_code (str): The cleaned field code to search for nested fields
 
         Returns:
             List[str]: List of nested field codes
         """
-        nested_fields = []
-        i = 0
-
-        while i < len(field_code):
-            if field_code[i] == "{":
-                # Find matching closing brace
-                brace_count = 1
-                j = i + 1
-
-                while j < len(field_code) and brace_count > 0:
-                    if field_code[j] == "{":
-                        brace_count += 1
-                    elif field_code[j] == "}":
-                        brace_count -= 1
-                    j += 1
-
-                if brace_count == 0:
-                    # Found complete nested field
-                    nested_field = field_code[i:j].strip()
-                    if len(nested_field) > 2:  # More than just {}
-                        # Clean up the nested field - remove extra spaces and field results
-                        inner_content = nested_field[1:-1].strip()
-                        if (
-                            inner_content and not inner_content.isspace()
-                        ):  # Only add if there's actual content
-                            # Also clean the inner content to remove field results
-                            cleaned_inner = self._clean_field_code(inner_content)
-                            if (
-                                cleaned_inner
-                            ):  # Only add if there's still content after cleaning
-                                nested_fields.append(f"{{ {cleaned_inner} }}")
-                    i = j
-                else:
-                    i += 1
-            else:
-                i += 1
-
-        return nested_fields
-
-    def _find_nested_fields(self, field_code: str) -> List[str]:
-        """
-        Find nested fields within a field code.
-
-        Args:
-            field_code (str): The field code to search for nested fields
+        # Most fields (e.g. a plain MERGEFIELD) contain no nested fields at all
+        if "{" not in field_code:
+            return []
 
-        Returns:
-            List[str]: List of nested field codes
-        """
+        # One pass pairs every closing brace with the latest unmatched opening one
+        spans = []
+        open_positions = []
+        for index, char in enumerate(field_code):
+            if char == "{":
+                open_positions.append(index)
+            elif char == "}" and open_positions:
+                spans.append((open_positions.pop(), index))
+
+        # Keep only the outermost fields; an opening brace that is never closed
+        # does not enclose anything
         nested_fields = []
-
-        # Look for patterns like { MERGEFIELD ... } within the field code
-        i = 0
-        while i < len(field_code):
-            if field_code[i] == "{":
-                # Find the matching closing brace
-                brace_count = 1
-                j = i + 1
-                while j < len(field_code) and brace_count > 0:
-                    if field_code[j] == "{":
-                        brace_count += 1
-                    elif field_code[j] == "}":
-                        brace_count -= 1
-                    j += 1
-
-                if brace_count == 0:
-                    nested_field = field_code[i:j].strip()
-                    nested_fields.append(nested_field)
-                    i = j
-                else:
-                    i += 1
-            else:
-                i += 1
+        last_end = -1
+        for start, end in sorted(spans):
+            if start < last_end:
+                continue
+            last_end = end
+
+            # The code is already cleaned once per field: it has no complete « »
+            # pairs left and is single-spaced, so inner content only needs
+            # trimming. Only add it if there's actual content.
+            cleaned_inner = field_code[start + 1 : end].strip()
+            if cleaned_inner:
+                nested_fields.append(f"{{ {cleaned_inner} }}")
 
         return nested_fields
 
@@ -370,13 +419,12 @@ class WordFieldExtractor:
         Returns:
             List[Dict[str, Any]]: List of all field dictionaries
         """
-        if not self.document:
+        if self.document is None:
             if not self.load_document():
                 return []
 
         # Use document-level processing to handle cross-paragraph fields
-        all_runs = self._collect_all_runs()
-        all_fields = self._process_runs_for_fields(all_runs)
+        all_fields = self._process_runs_for_fields(self._iter_all_runs())
 
         self.fields = all_fields
         return all_fields
@@ -396,41 +444,64 @@ class WordFieldExtractor:
             print("No fields found in the document.")
             return
 
-        print(f"\n{'='*60}")
-        print(f"WORD FIELDS FOUND IN: {self.document_path.name}")
-        print(f"{'='*60}")
-        print(f"Total fields found: {len(fields)}\n")
+        # Build the whole report and write it at once instead of a print per line
+        lines = [
+            "",
+            _REPORT_RULE,
+            f"WORD FIELDS FOUND IN: {self.document_path.name}",
+            _REPORT_RULE,
+            f"Total fields found: {len(fields)}",
+            "",
+        ]
 
         for i, field in enumerate(fields, 1):
-            print(f"Field #{i}")
-            print(f"{'─'*40}")
-            print(f"Type: {field['type']}")
-            print(f"Code: {field['code']}")
-            print(f"Full Text: {field['full_text']}")
+            lines.append(f"Field #{i}")
+            lines.append(_FIELD_RULE)
+            lines.append(f"Type: {field['type']}")
+            lines.append(f"Code: {field['code']}")
+            lines.append(f"Full Text: {field['full_text']}")
 
             if field["result"]:
-                print(f"Result: {field['result']}")
+                lines.append(f"Result: {field['result']}")
 
             if field["nested_fields"]:
-                print(f"Nested Fields ({len(field['nested_fields'])}):")
+                lines.append(f"Nested Fields ({len(field['nested_fields'])}):")
                 for j, nested in enumerate(field["nested_fields"], 1):
-                    print(f"  {j}. {nested}")
+                    lines.append(f"  {j}. {nested}")
 
-            print()  # Empty line between fields
+            lines.append("")  # Empty line between fields
+
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+
+
+@lru_cache(maxsize=32)
+def _extract_fields_cached(document_path: str, mtime: float):
+    """Extract fields once per file; the modification time is part of the cache key so edits are picked up."""
+    return tuple(WordFieldExtractor(document_path).extract_all_fields())
 
 
 def extract_fields_from_document(document_path: str) -> List[Dict[str, Any]]:
     """
     Convenience function to extract fields from a document.
 
+    Repeated calls on an unchanged file reuse the earlier extraction.
+
     Args:
         document_path (str): Path to the Word document
 
     Returns:
         List[Dict[str, Any]]: List of field dictionaries
     """
-    extractor = WordFieldExtractor(document_path)
-    return extractor.extract_all_fields()
+    path = Path(document_path).resolve()
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        # Let the extractor report the missing document
+        return WordFieldExtractor(document_path).extract_all_fields()
+
+    # Callers get their own copies, so mutating them cannot change the cache
+    return deepcopy(list(_extract_fields_cached(str(path), mtime)))
 
 
 def main():